@@ -26,7 +26,7 @@ Post-processing functions (pipe with >>)::
     cs.select(0, "css:.price >> normalize-space() >> uppercase()")
 """
 
-from chadselect._chadselect import ChadSelect
+from chadselect._chadselect import ChadSelect, memoize
 from chadselect._query import FUNCTION_PIPE, QueryType, parse_query
 from chadselect._functions import supported_text_functions
 
@@ -34,6 +34,7 @@ __all__ = [
     "ChadSelect",
     "FUNCTION_PIPE",
     "QueryType",
+    "memoize",
     "parse_query",
     "supported_text_functions",
 ]
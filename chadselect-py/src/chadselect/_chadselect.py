@@ -7,9 +7,14 @@ API-compatible with the Rust ``chadselect`` crate.
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from chadselect._query import ContentType, QueryType, parse_query, is_query_compatible
+import jmespath.parser
+
+from chadselect import _functions
+from chadselect._content import _ContentItem
+from chadselect._query import _COMPAT, ContentType, QueryType, parse_query
 from chadselect.engine import css as css_engine
 from chadselect.engine import xpath as xpath_engine
 from chadselect.engine import regex as regex_engine
@@ -17,20 +22,36 @@ from chadselect.engine import json as json_engine
 
 logger = logging.getLogger(__name__)
 
+_EngineFn = Callable[[str, _ContentItem], List[str]]
+
+#: Query type → engine ``process(expression, item)`` function.
+_ENGINE_DISPATCH: Dict[QueryType, _EngineFn] = {
+    QueryType.CSS: css_engine.process,
+    QueryType.XPATH: xpath_engine.process,
+    QueryType.REGEX: regex_engine.process,
+    QueryType.JSON: json_engine.process,
+}
+
 
 def _default_valid(s: str) -> bool:
     """Default validator — non-empty, non-whitespace."""
     return bool(s and s.strip())
 
 
-class _ContentItem:
-    """Internal content item with type tag."""
+def memoize(valid: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Mark a validator as safe to memoize within one ``*_where`` call.
 
-    __slots__ = ("content", "content_type")
+    :meth:`ChadSelect.select_first_where` and
+    :meth:`ChadSelect.select_many_where` then call it at most once per
+    distinct candidate string. Only use it on pure validators — stateful
+    ones would see fewer calls. Returns *valid* itself::
 
-    def __init__(self, content: str, content_type: ContentType) -> None:
-        self.content = content
-        self.content_type = content_type
+        @memoize
+        def plausible_price(s: str) -> bool:
+            return expensive_check(s)
+    """
+    valid._chadselect_memoize = True  # type: ignore[attr-defined]
+    return valid
 
 
 class ChadSelect:
@@ -95,26 +116,25 @@ class ChadSelect:
             List of matched strings. Never raises — invalid queries or
             out-of-bounds indices return ``[]``.
         """
-        query_type, expression = parse_query(query_str)
+        return self._run(index, *_prepare(query_str))
 
+    def _run(
+        self,
+        index: int,
+        expression: str,
+        compat: FrozenSet[ContentType],
+        engine_fn: _EngineFn,
+    ) -> List[str]:
+        """Execute an already-prepared query (see :func:`_prepare`)."""
         all_results: List[str] = []
 
         for item in self._content_list:
-            if not is_query_compatible(query_type, item.content_type):
-                continue
-
-            if query_type == QueryType.CSS:
-                results = css_engine.process(expression, item.content)
-            elif query_type == QueryType.XPATH:
-                results = xpath_engine.process(expression, item.content)
-            elif query_type == QueryType.REGEX:
-                results = regex_engine.process(expression, item.content)
-            elif query_type == QueryType.JSON:
-                results = json_engine.process(expression, item.content)
-            else:
-                results = []
-
-            all_results.extend(results)
+            if item.content_type in compat:
+                all_results.extend(engine_fn(expression, item))
+                # Only the match at ``index`` is wanted — once it exists,
+                # the remaining documents needn't be queried at all.
+                if 0 <= index < len(all_results):
+                    break
 
         return _select_by_index(all_results, index)
 
@@ -166,9 +186,15 @@ class ChadSelect:
         queries: Sequence[Tuple[int, str]],
         valid: Callable[[str], bool],
     ) -> List[str]:
-        """Like :meth:`select_first` but with a custom validity check."""
-        for index, query_str in queries:
-            result = self.query(index, query_str)
+        """Like :meth:`select_first` but with a custom validity check.
+
+        A validator marked with :func:`memoize` is called at most once per
+        distinct candidate string.
+        """
+        if getattr(valid, "_chadselect_memoize", False):
+            valid = _memo_valid(valid)
+        for prepared in _preparse_many(queries):
+            result = self._run(*prepared)
             if result and all(valid(r) for r in result):
                 return result
         return []
@@ -184,15 +210,21 @@ class ChadSelect:
         queries: Sequence[Tuple[int, str]],
         valid: Callable[[str], bool],
     ) -> List[str]:
-        """Like :meth:`select_many` but with a custom validity check."""
-        seen: set[str] = set()
-        out: List[str] = []
-        for index, query_str in queries:
-            for r in self.query(index, query_str):
-                if valid(r) and r not in seen:
-                    seen.add(r)
-                    out.append(r)
-        return out
+        """Like :meth:`select_many` but with a custom validity check.
+
+        A validator marked with :func:`memoize` is called at most once per
+        distinct candidate string.
+        """
+        if getattr(valid, "_chadselect_memoize", False):
+            valid = _memo_valid(valid)
+        # dict preserves insertion order — one hash table for both the
+        # membership test and the ordered output.
+        out: Dict[str, None] = {}
+        for prepared in _preparse_many(queries):
+            for r in self._run(*prepared):
+                if r not in out and valid(r):
+                    out[r] = None
+        return list(out)
 
     def query_batch(
         self, queries: Sequence[Tuple[int, str]]
@@ -202,7 +234,18 @@ class ChadSelect:
         Returns a list of result lists, one per input query, in order.
         This is the most efficient way to extract many fields.
         """
-        return [self.query(index, q) for index, q in queries]
+        done: Dict[Tuple[int, str], List[str]] = {}
+        out: List[List[str]] = []
+        for index, query_str in queries:
+            key = (index, query_str)
+            result = done.get(key)
+            if result is None:
+                result = done[key] = self.query(index, query_str)
+            else:
+                # Repeated pair — copy so callers never get aliased lists.
+                result = list(result)
+            out.append(result)
+        return out
 
     # ── Dunder ──────────────────────────────────────────────────────────
 
@@ -213,6 +256,64 @@ class ChadSelect:
         return self.content_count()
 
 
+def _prepare(query_str: str) -> Tuple[str, FrozenSet[ContentType], _EngineFn]:
+    """Resolve a query string to ``(expression, compatible_types, engine_fn)``."""
+    query_type, expression = parse_query(query_str)
+    return expression, _COMPAT[query_type], _ENGINE_DISPATCH[query_type]
+
+
+#: Every memoized compile step between a query string and its engine call.
+_COMPILE_CACHES = (
+    parse_query,
+    _functions._compile_chain,
+    css_engine._extract_pseudo,
+    css_engine._split_get_attr,
+    xpath_engine._compile,
+    regex_engine._compile,
+    json_engine._compile,
+)
+
+
+def _clear_compile_caches() -> None:
+    """Drop every compiled-expression cache (parsed documents are unaffected).
+
+    Besides chadselect's own caches this purges the ``re`` module cache
+    (regex queries and the regex-extract/regex-replace text functions) and
+    jmespath's parser cache, so nothing compiled stays warm.
+
+    Used by ``tests/bench.py --cold`` to time compile + run.
+    """
+    for cache in _COMPILE_CACHES:
+        cache.cache_clear()
+    re.purge()
+    jmespath.parser.Parser.purge()
+
+
+def _preparse_many(
+    queries: Sequence[Tuple[int, str]],
+) -> List[Tuple[int, str, FrozenSet[ContentType], _EngineFn]]:
+    """Prepare each distinct ``(index, query_str)`` pair up front, in first-seen order.
+
+    A repeated pair can't change a combined or first-valid result, so the
+    batch methods that use this run it only once.
+    """
+    unique = dict.fromkeys((index, query_str) for index, query_str in queries)
+    return [(index, *_prepare(query_str)) for index, query_str in unique]
+
+
+def _memo_valid(valid: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Wrap *valid* so each distinct string is checked once (per wrapper)."""
+    verdicts: Dict[str, bool] = {}
+
+    def check(r: str) -> bool:
+        verdict = verdicts.get(r)
+        if verdict is None:
+            verdict = verdicts[r] = bool(valid(r))
+        return verdict
+
+    return check
+
+
 def _select_by_index(results: List[str], index: int) -> List[str]:
     """Select results by index — ``-1`` means 'all'."""
     if index == -1:
@@ -0,0 +1,74 @@
+"""
+Content item storage with lazily-cached parsed representations.
+
+Mirrors the Rust crate's ``content.rs``: a document is parsed at most once
+per representation, regardless of how many queries run against it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from lxml import html as lxml_html
+from selectolax.parser import HTMLParser
+
+from chadselect import _jsonlib
+from chadselect._query import ContentType
+
+#: Marks a cache slot that has not been filled yet (``None`` is a valid
+#: parsed JSON value, so it can't double as the sentinel).
+_UNPARSED: Any = object()
+
+
+class _ContentItem:
+    """Internal content item with type tag and lazy parse caches.
+
+    Parse failures are not cached — they raise on every access, and the
+    calling engine logs and returns ``[]`` exactly as before.
+    """
+
+    __slots__ = (
+        "content",
+        "content_type",
+        "_html_tree",
+        "_html_text",
+        "_lxml_tree",
+        "_json_data",
+    )
+
+    def __init__(self, content: str, content_type: ContentType) -> None:
+        self.content = content
+        self.content_type = content_type
+        self._html_tree: Any = _UNPARSED
+        self._html_text: Any = _UNPARSED
+        self._lxml_tree: Any = _UNPARSED
+        self._json_data: Any = _UNPARSED
+
+    def html_tree(self) -> HTMLParser:
+        """selectolax tree for the CSS engine, parsed on first use."""
+        tree = self._html_tree
+        if tree is _UNPARSED:
+            tree = self._html_tree = HTMLParser(self.content)
+        return tree
+
+    def html_text(self) -> str:
+        """Whole-document stripped text of :meth:`html_tree`, computed on first use."""
+        text = self._html_text
+        if text is _UNPARSED:
+            root = self.html_tree().root
+            text = self._html_text = (root.text(strip=True) or "") if root is not None else ""
+        return text
+
+    def lxml_tree(self) -> Any:
+        """lxml tree for the XPath engine, parsed on first use."""
+        tree = self._lxml_tree
+        if tree is _UNPARSED:
+            tree = self._lxml_tree = lxml_html.fromstring(self.content)
+        return tree
+
+    def json_data(self) -> Any:
+        """Decoded JSON for the JMESPath engine, parsed on first use."""
+        data = self._json_data
+        if data is _UNPARSED:
+            data = self._json_data = _jsonlib.loads(self.content)
+        return data
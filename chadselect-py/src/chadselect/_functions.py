@@ -12,10 +12,17 @@ Mirrors the Rust crate's ``functions.rs`` exactly.
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
 
 from chadselect._query import FUNCTION_PIPE
 
+#: A compiled chain step — maps a result list to a new (empty-filtered) list.
+_Step = Callable[[List[str]], List[str]]
+
+# Matches 'x', 'y' or "x", "y"
+_TWO_ARGS_RE = re.compile(r"""['"](.*?)['"],\s*['"](.*?)['"]""")
+
 
 def supported_text_functions() -> List[str]:
     """Return the list of all supported text function signatures."""
@@ -51,146 +58,246 @@ def split_functions(input_str: str) -> Tuple[str, str]:
 
 def parse_and_apply(results: List[str], func_chain_str: str) -> List[str]:
     """Parse a function chain string and apply it to results."""
-    if not func_chain_str.strip():
-        return results
+    for step in _compile_chain(func_chain_str):
+        results = step(results)
+    return results
+
+
+@lru_cache(maxsize=512)
+def _compile_chain(func_chain_str: str) -> Tuple[_Step, ...]:
+    """Compile a ``>>``-separated chain into a tuple of step callables.
 
+    Cached on the raw chain string, so a chain applied to many documents is
+    split and parsed only once.
+    """
+    steps: List[_Step] = []
     for func_str in func_chain_str.split(FUNCTION_PIPE):
         func_str = func_str.strip()
-        if not func_str:
-            continue
-        results = _apply_one(results, func_str)
-        # Filter empty results after each step (matches Rust behavior)
-        results = [r for r in results if r]
-    return results
+        if func_str:
+            steps.append(_compile_one(func_str))
+    return tuple(steps)
+
+
+def _compile_one(func_str: str) -> _Step:
+    """Compile a single function call into a step, parsing its arguments once.
+
+    Every step filters empty results (matches Rust behavior).
+    """
+    name, args_str = _parse_func_str(func_str)
+    # Unknown function — skip silently
+    return _BUILDERS.get(name, _build_identity)(args_str)
 
 
-def _apply_one(results: List[str], func_str: str) -> List[str]:
-    """Apply a single function to all results."""
+def _parse_func_str(func_str: str) -> Tuple[str, str]:
+    """Split ``name(args)`` into ``(name, args_str)``."""
     paren = func_str.find("(")
     if paren == -1:
         # Shorthand without parens — e.g. "trim"
-        name = func_str.strip()
-        args_str = ""
-    else:
-        name = func_str[:paren].strip()
-        end = func_str.rfind(")")
-        args_str = func_str[paren + 1: end if end != -1 else len(func_str)]
-
-    if name == "normalize-space":
-        return [re.sub(r"\s+", " ", s).strip() for s in results]
-
-    if name == "trim":
-        return [s.strip() for s in results]
-
-    if name == "uppercase":
-        return [s.upper() for s in results]
-
-    if name == "lowercase":
-        return [s.lower() for s in results]
-
-    if name == "substring":
-        args = [a.strip() for a in args_str.split(",")]
-        if len(args) >= 2:
-            try:
-                start, length = int(args[0]), int(args[1])
-                return [s[start: start + length] for s in results]
-            except ValueError:
-                return results
-        return results
-
-    if name == "substring-after":
-        delim = args_str.strip().strip("\"'")
-        out = []
-        for s in results:
-            idx = s.find(delim)
-            out.append(s[idx + len(delim):] if idx != -1 else "")
-        # Filter out empty results (matches Rust behavior)
-        return [r for r in out if r]
+        return func_str.strip(), ""
+    end = func_str.rfind(")")
+    return func_str[:paren].strip(), func_str[paren + 1: end if end != -1 else len(func_str)]
 
-    if name == "substring-before":
-        delim = args_str.strip().strip("\"'")
-        out = []
-        for s in results:
-            idx = s.find(delim)
-            out.append(s[:idx] if idx != -1 else s)
-        return out
 
-    if name == "replace":
-        args = _parse_two_string_args(args_str)
-        if args:
-            find, repl = args
-            return [s.replace(find, repl) for s in results]
-        return results
-
-    if name == "get-attr":
-        # Handled specially by the CSS engine — pass through here
-        # (the attr name is extracted at the engine level)
-        return results
-
-    if name in ("join", "concat"):
-        # Fold the whole result list into one separator-joined string.
-        sep = args_str.strip().strip("\"'")
+# ── Step builders — ``args_str -> step`` ─────────────────────────────────────
+#
+# Arguments are parsed when the chain is compiled, so a cached chain applies
+# as a plain closure call per result batch.
+
+
+def _unquote(args_str: str) -> str:
+    return args_str.strip().strip("\"'")
+
+
+def _drop_empty(results: List[str]) -> List[str]:
+    return [r for r in results if r]
+
+
+def _drop_all(results: List[str]) -> List[str]:
+    return []
+
+
+def _build_identity(args_str: str) -> _Step:
+    return _drop_empty
+
+
+def _build_normalize_space(args_str: str) -> _Step:
+    # str.split() splits on exactly the characters ``\s`` matches (both use
+    # str.isspace), so this equals re.sub(r"\s+", " ", s).strip() — minus
+    # the regex engine.
+    return lambda rs: [t for t in (" ".join(s.split()) for s in rs) if t]
+
+
+def _build_trim(args_str: str) -> _Step:
+    return lambda rs: [t for t in (s.strip() for s in rs) if t]
+
+
+def _build_uppercase(args_str: str) -> _Step:
+    return lambda rs: [s.upper() for s in rs if s]
+
+
+def _build_lowercase(args_str: str) -> _Step:
+    return lambda rs: [s.lower() for s in rs if s]
+
+
+def _build_substring(args_str: str) -> _Step:
+    args = [a.strip() for a in args_str.split(",")]
+    if len(args) < 2:
+        return _drop_empty
+    try:
+        start, length = int(args[0]), int(args[1])
+    except ValueError:
+        return _drop_empty
+    stop = start + length
+    return lambda rs: [t for t in (s[start:stop] for s in rs) if t]
+
+
+def _build_substring_after(args_str: str) -> _Step:
+    delim = _unquote(args_str)
+    if not delim:
+        return _drop_empty
+    # partition() yields "" as the tail when the delimiter is missing, which
+    # is exactly the Rust behavior (and then gets filtered).
+    return lambda rs: [t for t in (s.partition(delim)[2] for s in rs) if t]
+
+
+def _build_substring_before(args_str: str) -> _Step:
+    delim = _unquote(args_str)
+    if not delim:
+        return _drop_all
+    # partition() yields the whole string as the head when delim is missing.
+    return lambda rs: [t for t in (s.partition(delim)[0] for s in rs) if t]
+
+
+def _build_replace(args_str: str) -> _Step:
+    args = _parse_two_string_args(args_str)
+    if not args:
+        return _drop_empty
+    find, repl = args
+    return lambda rs: [t for t in (s.replace(find, repl) for s in rs) if t]
+
+
+def _build_join(args_str: str) -> _Step:
+    # Fold the whole result list into one separator-joined string.
+    sep = _unquote(args_str)
+
+    def step(results: List[str]) -> List[str]:
         joined = sep.join(results)
         return [joined] if joined else []
 
-    if name == "translate":
-        # XPath translate(from, to): per-char map; chars in `from` with no
-        # counterpart in `to` are deleted. First occurrence in `from` wins.
-        args = _parse_two_string_args(args_str)
-        if args:
-            frm, to = args
-            table: dict = {}
-            for idx, ch in enumerate(frm):
-                if ord(ch) not in table:
-                    table[ord(ch)] = to[idx] if idx < len(to) else None
-            return [s.translate(table) for s in results]
-        return results
-
-    if name == "regex-extract":
-        pat = args_str.strip().strip("\"'")
-        try:
-            rx = re.compile(pat)
-        except re.error:
-            return results
+    return step
+
+
+def _build_translate(args_str: str) -> _Step:
+    # XPath translate(from, to): per-char map; chars in `from` with no
+    # counterpart in `to` are deleted. First occurrence in `from` wins.
+    args = _parse_two_string_args(args_str)
+    if not args:
+        return _drop_empty
+    frm, to = args
+    table: dict = {}
+    for idx, ch in enumerate(frm):
+        if ord(ch) not in table:
+            table[ord(ch)] = to[idx] if idx < len(to) else None
+    return lambda rs: [t for t in (s.translate(table) for s in rs) if t]
+
+
+def _build_regex_extract(args_str: str) -> _Step:
+    try:
+        rx = re.compile(_unquote(args_str))
+    except re.error:
+        return _drop_empty
+
+    def step(results: List[str]) -> List[str]:
         out = []
         for s in results:
             m = rx.search(s)
             if m:
-                out.append(m.group(1) if m.lastindex else m.group(0))
-        return [r for r in out if r]
-
-    if name == "regex-replace":
-        args = _parse_two_string_args(args_str)
-        if args:
-            pat, repl = args
-            try:
-                return [re.sub(pat, repl, s) for s in results]
-            except re.error:
-                return results
-        return results
-
-    if name == "substring-after-last":
-        delim = args_str.strip().strip("\"'")
+                r = m.group(1) if m.lastindex else m.group(0)
+                if r:
+                    out.append(r)
+        return out
+
+    return step
+
+
+def _build_regex_replace(args_str: str) -> _Step:
+    args = _parse_two_string_args(args_str)
+    if not args:
+        return _drop_empty
+    pat, repl = args
+    try:
+        rx = re.compile(pat)
+    except re.error:
+        return _drop_empty
+
+    def step(results: List[str]) -> List[str]:
+        try:
+            return [t for t in (rx.sub(repl, s) for s in results) if t]
+        except re.error:
+            # Bad replacement template (e.g. unknown group reference)
+            return _drop_empty(results)
+
+    return step
+
+
+def _build_substring_after_last(args_str: str) -> _Step:
+    delim = _unquote(args_str)
+    if not delim:
+        return _drop_all
+
+    def step(results: List[str]) -> List[str]:
         out = []
         for s in results:
-            idx = s.rfind(delim)
-            out.append(s[idx + len(delim):] if idx != -1 else "")
-        return [r for r in out if r]
+            _, sep, tail = s.rpartition(delim)
+            if sep and tail:
+                out.append(tail)
+        return out
 
-    if name == "substring-before-last":
-        delim = args_str.strip().strip("\"'")
-        return [
-            (s[: s.rfind(delim)] if s.rfind(delim) != -1 else s) for s in results
-        ]
+    return step
 
-    # Unknown function — skip silently
-    return results
+
+def _build_substring_before_last(args_str: str) -> _Step:
+    delim = _unquote(args_str)
+    if not delim:
+        return _drop_empty
+
+    def step(results: List[str]) -> List[str]:
+        out = []
+        for s in results:
+            head, sep, _ = s.rpartition(delim)
+            r = head if sep else s
+            if r:
+                out.append(r)
+        return out
+
+    return step
+
+
+_BUILDERS: Dict[str, Callable[[str], _Step]] = {
+    "normalize-space": _build_normalize_space,
+    "trim": _build_trim,
+    "uppercase": _build_uppercase,
+    "lowercase": _build_lowercase,
+    "substring": _build_substring,
+    "substring-after": _build_substring_after,
+    "substring-before": _build_substring_before,
+    "replace": _build_replace,
+    # Handled specially by the CSS engine — pass through here
+    # (the attr name is extracted at the engine level)
+    "get-attr": _build_identity,
+    "join": _build_join,
+    "concat": _build_join,
+    "translate": _build_translate,
+    "regex-extract": _build_regex_extract,
+    "regex-replace": _build_regex_replace,
+    "substring-after-last": _build_substring_after_last,
+    "substring-before-last": _build_substring_before_last,
+}
 
 
 def _parse_two_string_args(args_str: str) -> Tuple[str, str] | None:
     """Parse ``'find', 'replace'`` from an argument string."""
-    # Match 'x', 'y' or "x", "y"
-    m = re.match(r"""['"](.*?)['"],\s*['"](.*?)['"]""", args_str.strip())
+    m = _TWO_ARGS_RE.match(args_str.strip())
     if m:
         return m.group(1), m.group(2)
     return None
@@ -0,0 +1,47 @@
+"""
+JSON decode/encode helpers — ``orjson`` for decoding when installed, stdlib
+``json`` otherwise.
+
+``orjson`` is an optional speed-up (``pip install chadselect[fast]``). Every
+case where it would disagree with the stdlib is routed to the stdlib instead,
+so results never depend on whether it is installed:
+
+- ``NaN``/``Infinity`` literals and out-of-range floats — orjson rejects them.
+- Integers wider than 64 bits — orjson silently decodes them as floats (in
+  every release), so documents with a 19+ digit run never reach it.
+- Encoding always uses the stdlib — orjson formats floats differently
+  (``1e16`` vs ``1e+16``), writes non-finite floats as ``null`` and rejects
+  wide integers.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+# 19 digits reach below -2**63, orjson's lower int bound; longer runs may
+# exceed 2**64 - 1. Runs inside strings or fractions only cost a fallback.
+# Folding every digit to "0" turns the scan into one C substring search —
+# a ``\d{19}`` regex costs more than orjson's whole parse.
+_DIGITS_TO_ZERO = str.maketrans("123456789", "0" * 9)
+_WIDE_RUN = "0" * 19
+
+
+def loads(raw: str) -> Any:
+    """Decode a JSON document. Raises ``json.JSONDecodeError`` when invalid."""
+    if orjson is not None and _WIDE_RUN not in raw.translate(_DIGITS_TO_ZERO):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # let the stdlib decide (and raise its own error)
+    return json.loads(raw)
+
+
+def dumps(value: Any) -> str:
+    """Encode a value as compact JSON, leaving non-ASCII characters as-is."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
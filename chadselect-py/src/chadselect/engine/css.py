@@ -13,10 +13,12 @@ from __future__ import annotations
 
 import logging
 import re as _re
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
-from selectolax.parser import HTMLParser, Node
+from selectolax.parser import Node
 
+from chadselect._content import _ContentItem
 from chadselect._functions import split_functions, parse_and_apply
 
 logger = logging.getLogger(__name__)
@@ -30,12 +32,21 @@ _PSEUDO_RE = _re.compile(
     r"\(\s*(?:'(?P<sq>[^']*)'|\"(?P<dq>[^\"]*)\"|(?P<uq>[^)]*?))\s*\)"
 )
 
+# ── get-attr extraction ──────────────────────────────────────────────────────
+_GET_ATTR_RE = _re.compile(r"get-attr\(['\"](\w[\w-]*?)['\"]\)")
+_GET_ATTR_STRIP_RE = _re.compile(r"\s*get-attr\(['\"][\w-]+?['\"]\)\s*")
+_PIPE_COLLAPSE_RE = _re.compile(r"(>>\s*)+")
 
+
+@lru_cache(maxsize=512)
 def _extract_pseudo(selector: str) -> Tuple[str, Optional[str], Optional[str], str]:
     """Split a selector into (base_selector, pseudo_name, pseudo_arg, trailing).
 
     Returns ``(selector, None, None, "")`` when no custom pseudo is present.
     """
+    # Every custom pseudo starts with ':' — most selectors have none.
+    if ":" not in selector:
+        return selector, None, None, ""
     m = _PSEUDO_RE.search(selector)
     if not m:
         return selector, None, None, ""
@@ -54,19 +65,14 @@ def _node_text(node: Node) -> str:
     return (node.text(strip=True) or "").strip()
 
 
-def _matches_pseudo(node: Node, pseudo: str, arg: str) -> bool:
-    text = _node_text(node)
-    if pseudo == "has-text":
-        return arg in text
-    if pseudo == "contains-text":
-        return arg in text
-    if pseudo == "text-equals":
-        return text == arg
-    if pseudo == "text-starts":
-        return text.startswith(arg)
-    if pseudo == "text-ends":
-        return text.endswith(arg)
-    return False
+#: Pseudo name → ``(node_text, arg) -> bool`` predicate.
+_PSEUDO_TESTS: Dict[str, Callable[[str, str], bool]] = {
+    "has-text": lambda text, arg: arg in text,
+    "contains-text": lambda text, arg: arg in text,
+    "text-equals": str.__eq__,
+    "text-starts": str.startswith,
+    "text-ends": str.endswith,
+}
 
 
 def _next_element(node: Node) -> Optional[Node]:
@@ -107,16 +113,14 @@ def _apply_post(node: Node, post: str) -> List[Node]:
         return []
 
 
-def process(selector_with_functions: str, html: str) -> List[str]:
+def process(selector_with_functions: str, item: _ContentItem) -> List[str]:
     """Run a CSS selector against HTML content, with optional ``>>`` functions."""
     selector, func_chain = split_functions(selector_with_functions)
 
     # Check for get-attr in the function chain — need to handle before parsing
-    attr_name = _extract_get_attr(func_chain)
-    if attr_name:
-        func_chain = _remove_get_attr(func_chain)
+    attr_name, func_chain = _split_get_attr(func_chain)
 
-    tree = HTMLParser(html)
+    tree = item.html_tree()
 
     # ── custom pseudo-selector handling ──────────────────────────────────
     base, pseudo, pseudo_arg, trailing = _extract_pseudo(selector)
@@ -127,9 +131,16 @@ def process(selector_with_functions: str, html: str) -> List[str]:
             logger.warning("CSS selector failed for '%s': %s", base, e)
             return []
 
+        # Every candidate's stripped text is a substring of the whole
+        # document's, so an argument missing from the document can't match
+        # anywhere — skip per-candidate text extraction entirely.
+        if pseudo_arg not in item.html_text():  # type: ignore[operator]
+            candidates = []
+
+        text_test = _PSEUDO_TESTS[pseudo]
         matched_nodes: List[Node] = []
         for node in candidates:
-            if _matches_pseudo(node, pseudo, pseudo_arg):  # type: ignore[arg-type]
+            if text_test(_node_text(node), pseudo_arg):  # type: ignore[arg-type]
                 if trailing:
                     # e.g. ":has-text('Exterior:') .value" (descendant), or a
                     # combinator like ":text-equals('X') + span" (sibling).
@@ -162,17 +173,17 @@ def process(selector_with_functions: str, html: str) -> List[str]:
     return results
 
 
-def _extract_get_attr(func_chain: str) -> str | None:
-    """Extract the attribute name from a ``get-attr('name')`` call."""
-    import re
-    m = re.search(r"get-attr\(['\"](\w[\w-]*?)['\"]\)", func_chain)
-    return m.group(1) if m else None
+@lru_cache(maxsize=512)
+def _split_get_attr(func_chain: str) -> Tuple[Optional[str], str]:
+    """Split a ``get-attr('name')`` call out of a function chain.
 
-
-def _remove_get_attr(func_chain: str) -> str:
-    """Remove ``get-attr(...)`` from a function chain string."""
-    import re
-    cleaned = re.sub(r"\s*get-attr\(['\"][\w-]+?['\"]\)\s*", " ", func_chain)
+    Returns ``(attr_name, remaining_chain)``, or ``(None, func_chain)`` when
+    the chain has no ``get-attr``.
+    """
+    m = _GET_ATTR_RE.search(func_chain)
+    if not m:
+        return None, func_chain
+    cleaned = _GET_ATTR_STRIP_RE.sub(" ", func_chain)
     # Clean up stray >> delimiters
-    cleaned = re.sub(r"(>>\s*)+", ">> ", cleaned).strip().strip(">>").strip()
-    return cleaned
+    cleaned = _PIPE_COLLAPSE_RE.sub(">> ", cleaned).strip().strip(">>").strip()
+    return m.group(1), cleaned
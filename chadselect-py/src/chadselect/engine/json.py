@@ -1,19 +1,197 @@
-"""JMESPath engine — powered by the ``jmespath`` library."""
+"""JMESPath engine — powered by the ``jmespath`` library.
+
+Expressions are parsed by ``jmespath`` and their AST is compiled into nested
+closures for the common node types (fields, indexes, projections, flatten,
+filters). Any other node is evaluated by ``jmespath``'s own interpreter, so
+results are identical to ``jmespath.search``.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
 
 import jmespath
+from jmespath.visitor import TreeInterpreter
 
+from chadselect import _jsonlib
+from chadselect._content import _ContentItem
 from chadselect._functions import split_functions, parse_and_apply
 
 logger = logging.getLogger(__name__)
 
 
-def process(jmespath_with_functions: str, raw_json: str) -> List[str]:
+#: A compiled JMESPath (sub)expression — maps the current value to a result.
+_Eval = Callable[[Any], Any]
+
+#: Shared interpreter for node types without a closure builder. It holds no
+#: per-search state; ``ParsedResult.search`` would build one on every call.
+_INTERPRETER = TreeInterpreter()
+
+
+@lru_cache(maxsize=512)
+def _compile(expr: str) -> _Eval:
+    """Compile (and memoize) a JMESPath expression. Invalid ones raise."""
+    return _build(jmespath.compile(expr).parsed)
+
+
+def _build(node: Dict[str, Any]) -> _Eval:
+    builder = _NODE_BUILDERS.get(node["type"])
+    if builder is None:
+        visit = _INTERPRETER.visit
+        return lambda value: visit(node, value)
+    return builder(node)
+
+
+def _is_true(value: Any) -> bool:
+    """JMESPath truthiness — ``0`` is true; empty string/list/object are false."""
+    return not (value == "" or value == [] or value == {} or value is None or value is False)
+
+
+# ── Node builders — ``ast node -> evaluator`` ────────────────────────────────
+#
+# Each mirrors the matching ``TreeInterpreter.visit_*`` method exactly.
+
+
+def _build_identity(node: Dict[str, Any]) -> _Eval:
+    return lambda value: value
+
+
+def _build_literal(node: Dict[str, Any]) -> _Eval:
+    literal = node["value"]
+    return lambda value: literal
+
+
+def _build_field(node: Dict[str, Any]) -> _Eval:
+    name = node["value"]
+    return lambda value: value.get(name) if isinstance(value, dict) else None
+
+
+def _build_index(node: Dict[str, Any]) -> _Eval:
+    index = node["value"]
+
+    def run(value: Any) -> Any:
+        if not isinstance(value, list):
+            return None
+        try:
+            return value[index]
+        except IndexError:
+            return None
+
+    return run
+
+
+def _build_chain(node: Dict[str, Any]) -> _Eval:
+    """``a.b``, ``a[0]`` and ``a | b`` — feed each child the previous result."""
+    evals = tuple(_build(child) for child in node["children"])
+    if all(child["type"] == "field" for child in node["children"]):
+        names = tuple(child["value"] for child in node["children"])
+
+        def run_fields(value: Any) -> Any:
+            for name in names:
+                value = value.get(name) if isinstance(value, dict) else None
+            return value
+
+        return run_fields
+
+    def run(value: Any) -> Any:
+        for ev in evals:
+            value = ev(value)
+        return value
+
+    return run
+
+
+def _build_flatten(node: Dict[str, Any]) -> _Eval:
+    base_eval = _build(node["children"][0])
+
+    def run(value: Any) -> Any:
+        base = base_eval(value)
+        if not isinstance(base, list):
+            return None
+        merged: List[Any] = []
+        for element in base:
+            if isinstance(element, list):
+                merged.extend(element)
+            else:
+                merged.append(element)
+        return merged
+
+    return run
+
+
+def _build_projection(node: Dict[str, Any]) -> _Eval:
+    left, right = node["children"]
+    base_eval = _build(left)
+
+    if right["type"] == "identity":
+
+        def run_identity(value: Any) -> Any:
+            base = base_eval(value)
+            if not isinstance(base, list):
+                return None
+            return [e for e in base if e is not None]
+
+        return run_identity
+
+    if right["type"] == "field":
+        name = right["value"]
+
+        def run_field(value: Any) -> Any:
+            base = base_eval(value)
+            if not isinstance(base, list):
+                return None
+            return [r for e in base if isinstance(e, dict) and (r := e.get(name)) is not None]
+
+        return run_field
+
+    right_eval = _build(right)
+
+    def run(value: Any) -> Any:
+        base = base_eval(value)
+        if not isinstance(base, list):
+            return None
+        return [r for e in base if (r := right_eval(e)) is not None]
+
+    return run
+
+
+def _build_filter_projection(node: Dict[str, Any]) -> _Eval:
+    left, right, condition = node["children"]
+    base_eval = _build(left)
+    right_eval = _build(right)
+    cond_eval = _build(condition)
+
+    def run(value: Any) -> Any:
+        base = base_eval(value)
+        if not isinstance(base, list):
+            return None
+        return [
+            r for e in base
+            if _is_true(cond_eval(e)) and (r := right_eval(e)) is not None
+        ]
+
+    return run
+
+
+_NODE_BUILDERS: Dict[str, Callable[[Dict[str, Any]], _Eval]] = {
+    "identity": _build_identity,
+    "current": _build_identity,
+    "literal": _build_literal,
+    "field": _build_field,
+    "index": _build_index,
+    "subexpression": _build_chain,
+    "index_expression": _build_chain,
+    "pipe": _build_chain,
+    "flatten": _build_flatten,
+    "projection": _build_projection,
+    "filter_projection": _build_filter_projection,
+}
+
+
+def process(jmespath_with_functions: str, item: _ContentItem) -> List[str]:
     """Run a JMESPath expression against JSON content.
 
     Returns all result values stringified. Supports ``>>`` function piping.
@@ -21,13 +199,13 @@ def process(jmespath_with_functions: str, raw_json: str) -> List[str]:
     expr, func_chain = split_functions(jmespath_with_functions)
 
     try:
-        data = json.loads(raw_json)
+        data = item.json_data()
     except json.JSONDecodeError as e:
         logger.warning("Invalid JSON content: %s", e)
         return []
 
     try:
-        result = jmespath.search(expr, data)
+        result = _compile(expr)(data)
     except Exception as e:
         logger.warning("JMESPath failed for '%s': %s", expr, e)
         return []
@@ -62,5 +240,5 @@ def _stringify(value) -> str:
     if isinstance(value, bool):
         return str(value).lower()
     if isinstance(value, (dict, list)):
-        return json.dumps(value, separators=(",", ":"))
+        return _jsonlib.dumps(value)
     return str(value)
@@ -4,14 +4,22 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import List
 
+from chadselect._content import _ContentItem
 from chadselect._functions import split_functions, parse_and_apply
 
 logger = logging.getLogger(__name__)
 
 
-def process(pattern_with_functions: str, content: str) -> List[str]:
+@lru_cache(maxsize=512)
+def _compile(pattern_str: str) -> "re.Pattern[str]":
+    """Compile (and memoize) a regex pattern. Invalid patterns raise ``re.error``."""
+    return re.compile(pattern_str)
+
+
+def process(pattern_with_functions: str, item: _ContentItem) -> List[str]:
     """Run a regex against content, returning capture groups or full matches.
 
     - If the pattern has capture groups, returns group values.
@@ -22,7 +30,7 @@ def process(pattern_with_functions: str, content: str) -> List[str]:
     pattern_str, func_chain = split_functions(pattern_with_functions)
 
     try:
-        compiled = re.compile(pattern_str)
+        compiled = _compile(pattern_str)
     except re.error as e:
         logger.warning("Invalid regex '%s': %s", pattern_str, e)
         return []
@@ -31,10 +39,10 @@ def process(pattern_with_functions: str, content: str) -> List[str]:
 
     if compiled.groups == 0:
         # No capture groups — return full matches
-        results = compiled.findall(content)
+        results = compiled.findall(item.content)
     else:
         # Has capture groups
-        for match in compiled.finditer(content):
+        for match in compiled.finditer(item.content):
             groups = match.groups()
             for g in groups:
                 if g is not None:
@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import List
 
-from lxml import html as lxml_html
+from lxml import etree
 
+from chadselect._content import _ContentItem
 from chadselect._functions import split_functions, parse_and_apply
 
 logger = logging.getLogger(__name__)
 
 
-def process(xpath_with_functions: str, content: str) -> List[str]:
+@lru_cache(maxsize=512)
+def _compile(xpath_expr: str) -> etree.XPath:
+    """Compile (and memoize) an XPath expression. Invalid ones raise."""
+    return etree.XPath(xpath_expr)
+
+
+def process(xpath_with_functions: str, item: _ContentItem) -> List[str]:
     """Run an XPath 1.0 expression against HTML/text content.
 
     Supports ``>>`` function piping.
@@ -20,8 +28,8 @@ def process(xpath_with_functions: str, content: str) -> List[str]:
     xpath_expr, func_chain = split_functions(xpath_with_functions)
 
     try:
-        tree = lxml_html.fromstring(content)
-        raw = tree.xpath(xpath_expr)
+        compiled = _compile(xpath_expr)
+        raw = compiled(item.lxml_tree())
     except Exception as e:
         logger.warning("XPath failed for '%s': %s", xpath_expr, e)
         return []
@@ -32,13 +40,16 @@ def process(xpath_with_functions: str, content: str) -> List[str]:
         raw = [raw]
 
     results: List[str] = []
-    for item in raw:
-        if hasattr(item, "text_content"):
+    for node in raw:
+        if isinstance(node, str):
+            # It's a string (text node or attribute) — tested first so the
+            # common case never pays for a failing hasattr() lookup.
+            text = node.strip()
+        elif hasattr(node, "text_content"):
             # It's an Element
-            text = item.text_content().strip()
+            text = node.text_content().strip()
         else:
-            # It's a string (text node or attribute)
-            text = str(item).strip()
+            text = str(node).strip()
         if text:
             results.append(text)
 
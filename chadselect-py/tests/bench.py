@@ -6,18 +6,40 @@ Uses the **same fixtures and queries** as ``chadselect-rs/benches/engine_bench.r
 so results are directly comparable.
 
 Usage:
-    python tests/bench.py            # default 2000 iterations
-    python tests/bench.py -n 500     # custom iteration count
+    python tests/bench.py            # default 2000 samples
+    python tests/bench.py -n 500     # custom sample count
+    python tests/bench.py -t 0       # no per-task time budget: always take -n samples
+    python tests/bench.py --cold     # include expression compile in every iteration
+    python tests/bench.py -j 0       # run tasks in parallel, one process per core
+
+By default query strings hit chadselect's compiled-expression caches after
+the warm-up call, so timings measure query *execution* — like the Rust
+bench. ``--cold`` clears those caches — and the ``re`` and jmespath
+parser caches underneath them — before every iteration to measure compile +
+run (documents stay parsed in both modes).
+
+Each warm sample times a batch of calls sized to take at least 200 µs and
+reports the per-call mean, so timer overhead doesn't skew sub-µs queries.
+Sampling stops early once a task has used its time budget (``-t``, default
+1 s) and has at least ``MIN_SAMPLES``, so slow queries don't stretch the run.
+
+``-j/--jobs`` spreads tasks over a process pool to cut wall time. Tasks then
+compete for cores, caches and memory bandwidth, so keep the serial default
+when the numbers matter.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import statistics
 import time
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, NamedTuple
 
 from chadselect import ChadSelect
+from chadselect._chadselect import _clear_compile_caches
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Fixtures — identical to chadselect-rs/benches/engine_bench.rs
@@ -29,23 +51,34 @@ CAT1 = ["tools", "electronics", "home", "garden", "toys"]
 CAT2 = ["home", "office", "outdoor", "kitchen", "garage"]
 
 
+_PRODUCT_HTML = (
+    '  <div class="product" data-sku="SKU-{i:03d}">\n'
+    '    <h2 class="title">Product {i}</h2>\n'
+    '    <span class="price original">${orig}.99</span>\n'
+    '    <span class="price current">${cur}.99</span>\n'
+    '    <span class="vin">VIN: 1HGCM{i:05d}A{extra:06d}</span>\n'
+    '    <div class="details">\n'
+    '      <div class="spec"><span class="label">Color:</span> <span class="value">{color}</span></div>\n'
+    '      <div class="spec"><span class="label">Engine:</span> <span class="value">{engine}</span></div>\n'
+    '    </div>\n'
+    '    <a class="buy" href="/buy/{i}">Buy Now</a>\n'
+    '  </div>'
+)
+
+
 def _ecommerce_html() -> str:
     """200-product e-commerce page (~30 KB)."""
-    rows = []
-    for i in range(200):
-        rows.append(
-            f'  <div class="product" data-sku="SKU-{i:03d}">\n'
-            f'    <h2 class="title">Product {i}</h2>\n'
-            f'    <span class="price original">${100 + i * 5}.99</span>\n'
-            f'    <span class="price current">${80 + i * 4}.99</span>\n'
-            f'    <span class="vin">VIN: 1HGCM{i:05d}A{100_000 + i * 7:06d}</span>\n'
-            f'    <div class="details">\n'
-            f'      <div class="spec"><span class="label">Color:</span> <span class="value">{COLORS[i % 5]}</span></div>\n'
-            f'      <div class="spec"><span class="label">Engine:</span> <span class="value">{ENGINES[i % 5]}</span></div>\n'
-            f'    </div>\n'
-            f'    <a class="buy" href="/buy/{i}">Buy Now</a>\n'
-            f'  </div>'
+    rows = [
+        _PRODUCT_HTML.format(
+            i=i,
+            orig=100 + i * 5,
+            cur=80 + i * 4,
+            extra=100_000 + i * 7,
+            color=COLORS[i % 5],
+            engine=ENGINES[i % 5],
         )
+        for i in range(200)
+    ]
     return "<html><body>\n<div class=\"products\">\n" + "\n".join(rows) + "\n</div>\n</body></html>"
 
 
@@ -75,17 +108,28 @@ def _news_html() -> str:
     )
 
 
+_PRODUCT_JSON = (
+    '{{"id":{i},"name":"Product {i}","price":{price}.99,'
+    '"in_stock":{stock},'
+    '"categories":["{cat1}","{cat2}"],'
+    '"specs":{{"weight":"{w}kg","color":"{color}"}}}}'
+)
+
+
 def _api_json() -> str:
     """200-item JSON API response."""
-    items = []
-    for i in range(200):
-        stock = "false" if i % 3 == 0 else "true"
-        items.append(
-            f'{{"id":{i},"name":"Product {i}","price":{10 + i * 3}.99,'
-            f'"in_stock":{stock},'
-            f'"categories":["{CAT1[i % 5]}","{CAT2[i % 5]}"],'
-            f'"specs":{{"weight":"{1 + i % 10}.{i % 10}kg","color":"{COLORS[i % 5]}"}}}}'
+    items = [
+        _PRODUCT_JSON.format(
+            i=i,
+            price=10 + i * 3,
+            stock="false" if i % 3 == 0 else "true",
+            cat1=CAT1[i % 5],
+            cat2=CAT2[i % 5],
+            w=f"{1 + i % 10}.{i % 10}",
+            color=COLORS[i % 5],
         )
+        for i in range(200)
+    ]
     return '{"api_version":"2.1","products":[' + ",".join(items) + "]}"
 
 
@@ -95,38 +139,51 @@ NEWS_HTML = _news_html()
 API_JSON = _api_json()
 
 # ═══════════════════════════════════════════════════════════════════════════════
-#  Benchmark tasks — (label, content_type, content, index, query)
+#  Benchmark tasks
 #  Same 20 queries as the Rust Criterion bench.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-TASKS: List[Tuple[str, str, str, int, str]] = [
+class Task(NamedTuple):
+    engine: str
+    name: str
+    content_type: str
+    content: str
+    index: int
+    query: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.engine:<5} — {self.name}"
+
+
+TASKS: List[Task] = [
     # ── CSS (6) ──────────────────────────────────────────────────────────
-    ("CSS  — product titles",           "html", ECOMMERCE_HTML, -1, "css:.title"),
-    ("CSS  — current prices",           "html", ECOMMERCE_HTML, -1, "css:.price.current"),
-    ("CSS  — buy link hrefs",           "html", ECOMMERCE_HTML, -1, "css:a.buy >> get-attr('href')"),
-    ("CSS  — ticker symbols",           "html", NEWS_HTML,      -1, "css:.ticker"),
-    ("CSS  — first VIN + chain",        "html", ECOMMERCE_HTML,  0, "css:.vin >> substring-after('VIN: ') >> uppercase()"),
-    ("CSS  — all data-sku attrs",       "html", ECOMMERCE_HTML, -1, "css:.product >> get-attr('data-sku')"),
+    Task("CSS",   "product titles",             "html", ECOMMERCE_HTML, -1, "css:.title"),
+    Task("CSS",   "current prices",             "html", ECOMMERCE_HTML, -1, "css:.price.current"),
+    Task("CSS",   "buy link hrefs",             "html", ECOMMERCE_HTML, -1, "css:a.buy >> get-attr('href')"),
+    Task("CSS",   "ticker symbols",             "html", NEWS_HTML,      -1, "css:.ticker"),
+    Task("CSS",   "first VIN + chain",          "html", ECOMMERCE_HTML,  0, "css:.vin >> substring-after('VIN: ') >> uppercase()"),
+    Task("CSS",   "all data-sku attrs",         "html", ECOMMERCE_HTML, -1, "css:.product >> get-attr('data-sku')"),
 
     # ── XPath (6) ────────────────────────────────────────────────────────
-    ("XPath — current prices",          "html", ECOMMERCE_HTML, -1, "xpath://span[@class='price current']/text()"),
-    ("XPath — buy link hrefs",          "html", ECOMMERCE_HTML, -1, "xpath://a[@class='buy']/@href"),
-    ("XPath — headline",                "html", NEWS_HTML,       0, "xpath://h1[@class='headline']/text()"),
-    ("XPath — all data-skus",           "html", ECOMMERCE_HTML, -1, "xpath://div[@class='product']/@data-sku"),
-    ("XPath — union (h1|h2)",           "html", ECOMMERCE_HTML, -1, "xpath://h1/text() | //h2/text()"),
-    ("XPath — normalize-space",         "html", NEWS_HTML,       0, "xpath:normalize-space(//h1)"),
+    Task("XPath", "current prices",             "html", ECOMMERCE_HTML, -1, "xpath://span[@class='price current']/text()"),
+    Task("XPath", "buy link hrefs",             "html", ECOMMERCE_HTML, -1, "xpath://a[@class='buy']/@href"),
+    Task("XPath", "headline",                   "html", NEWS_HTML,       0, "xpath://h1[@class='headline']/text()"),
+    Task("XPath", "all data-skus",              "html", ECOMMERCE_HTML, -1, "xpath://div[@class='product']/@data-sku"),
+    Task("XPath", "union (h1|h2)",              "html", ECOMMERCE_HTML, -1, "xpath://h1/text() | //h2/text()"),
+    Task("XPath", "normalize-space",            "html", NEWS_HTML,       0, "xpath:normalize-space(//h1)"),
 
     # ── Regex (4) ────────────────────────────────────────────────────────
-    ("Regex — dollar prices",           "html", ECOMMERCE_HTML, -1, r"regex:\$[\d,]+\.\d{2}"),
-    ("Regex — VIN numbers",             "html", ECOMMERCE_HTML, -1, r"regex:VIN:\s*([\w]+)"),
-    ("Regex — data-sku capture",        "html", ECOMMERCE_HTML, -1, r'regex:data-sku="(SKU-\d+)"'),
-    ("Regex — pct changes",             "html", NEWS_HTML,      -1, r"regex:[+-]\d+\.\d+%"),
+    Task("Regex", "dollar prices",              "html", ECOMMERCE_HTML, -1, r"regex:\$[\d,]+\.\d{2}"),
+    Task("Regex", "VIN numbers",                "html", ECOMMERCE_HTML, -1, r"regex:VIN:\s*([\w]+)"),
+    Task("Regex", "data-sku capture",           "html", ECOMMERCE_HTML, -1, r'regex:data-sku="(SKU-\d+)"'),
+    Task("Regex", "pct changes",                "html", NEWS_HTML,      -1, r"regex:[+-]\d+\.\d+%"),
 
     # ── JMESPath (4) ─────────────────────────────────────────────────────
-    ("JSON  — product names",           "json", API_JSON,       -1, "json:products[].name"),
-    ("JSON  — in-stock filter",         "json", API_JSON,       -1, "json:products[?in_stock].name"),
-    ("JSON  — nested spec",             "json", API_JSON,        0, "json:products[0].specs.weight"),
-    ("JSON  — flatten categories",      "json", API_JSON,       -1, "json:products[].categories[]"),
+    Task("JSON",  "product names",              "json", API_JSON,       -1, "json:products[].name"),
+    Task("JSON",  "in-stock filter",            "json", API_JSON,       -1, "json:products[?in_stock].name"),
+    Task("JSON",  "nested spec",                "json", API_JSON,        0, "json:products[0].specs.weight"),
+    Task("JSON",  "flatten categories",         "json", API_JSON,       -1, "json:products[].categories[]"),
 ]
 
 
@@ -134,43 +191,89 @@ TASKS: List[Tuple[str, str, str, int, str]] = [
 #  Runner
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def bench_task(
-    label: str,
-    content_type: str,
-    content: str,
-    index: int,
-    query: str,
-    n: int,
-) -> dict:
-    """Run a single benchmark task *n* times, return timing stats."""
-    # Pre-load ChadSelect once (parsing cost is separate from query cost)
+#: Task content_type → the ChadSelect method that loads it.
+_ADD = {
+    "html": ChadSelect.add_html,
+    "json": ChadSelect.add_json,
+    "text": ChadSelect.add_text,
+}
+
+
+@lru_cache(maxsize=None)
+def _loaded(content_type: str, content: str) -> ChadSelect:
+    """Pre-loaded ChadSelect shared by every task on the same fixture.
+
+    Parsing cost is separate from query cost, and each document's parse
+    caches fill once per process instead of once per task.
+    """
     cs = ChadSelect()
-    if content_type == "html":
-        cs.add_html(content)
-    elif content_type == "json":
-        cs.add_json(content)
-    else:
-        cs.add_text(content)
+    _ADD[content_type](cs, content)
+    return cs
+
+
+#: Samples every task takes even after its time budget runs out.
+MIN_SAMPLES = 50
+
+#: Minimum wall time per timed batch (cf. ``timeit.Timer.autorange``).
+MIN_BATCH_NS = 200_000
+
+
+def _calibrate_batch(cs: ChadSelect, index: int, query: str) -> int:
+    """Smallest batch size in the 1, 2, 5, 10, … sequence taking ≥ MIN_BATCH_NS."""
+    i = 1
+    while True:
+        for batch in (i, 2 * i, 5 * i):
+            t0 = time.perf_counter_ns()
+            for _ in range(batch):
+                cs.query(index, query)
+            if time.perf_counter_ns() - t0 >= MIN_BATCH_NS:
+                return batch
+        i *= 10
+
+
+def bench_task(task: Task, n: int, cold: bool = False, budget_s: float = 0.0) -> dict:
+    """Take up to *n* timing samples of a single benchmark task, return stats.
+
+    With a positive *budget_s*, sampling stops once that many seconds have
+    passed and at least ``MIN_SAMPLES`` (or *n*, if smaller) were taken.
+    """
+    index, query = task.index, task.query
+    cs = _loaded(task.content_type, task.content)
 
     # Warm-up
     result = cs.query(index, query)
 
-    timings: List[float] = []
-    for _ in range(n):
+    # Time batches of `batch` calls so a sub-µs query isn't swamped by the
+    # timer and list overhead; each sample is the per-call mean of a batch.
+    # Cold runs keep batch=1 so cache clearing stays outside the clock.
+    batch = 1 if cold else _calibrate_batch(cs, index, query)
+
+    timings = [0.0] * n
+    taken = n
+    deadline = time.perf_counter_ns() + int(budget_s * 1e9) if budget_s > 0 else None
+    for i in range(n):
+        if deadline is not None and i >= MIN_SAMPLES and time.perf_counter_ns() >= deadline:
+            taken = i
+            break
+        if cold:
+            _clear_compile_caches()
         t0 = time.perf_counter_ns()
-        cs.query(index, query)
+        for _ in range(batch):
+            cs.query(index, query)
         t1 = time.perf_counter_ns()
-        timings.append((t1 - t0) / 1_000)  # → µs
+        timings[i] = (t1 - t0) / batch / 1_000  # → µs per call
+    del timings[taken:]
 
-    timings.sort()
+    # Percentiles 1..99, linearly interpolated over the samples' full range.
+    pct = statistics.quantiles(timings, n=100, method="inclusive")
     return {
-        "label": label,
         "result_count": len(result),
-        "median": statistics.median(timings),
-        "mean": statistics.mean(timings),
+        "samples": taken,
+        "median": pct[49],
+        "mean": statistics.fmean(timings),
         "min": min(timings),
-        "p95": timings[int(len(timings) * 0.95)],
-        "p99": timings[int(len(timings) * 0.99)],
+        "p95": pct[94],
+        "p99": pct[98],
     }
 
 
@@ -182,35 +285,53 @@ def fmt_us(v: float) -> str:
 
 def main():
     parser = argparse.ArgumentParser(description="ChadSelect Python benchmark")
-    parser.add_argument("-n", type=int, default=2000, help="iterations per task (default: 2000)")
+    parser.add_argument("-n", type=int, default=2000, help="max timing samples per task (default: 2000)")
+    parser.add_argument(
+        "--cold", action="store_true",
+        help="clear compiled-expression caches before every iteration (compile + run)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="worker processes; 0 = one per core (default: 1, serial)",
+    )
+    parser.add_argument(
+        "-t", "--time", type=float, default=1.0, metavar="SECONDS",
+        help="time budget per task; 0 = none (default: 1.0)",
+    )
     args = parser.parse_args()
     n = args.n
+    if n < 2:
+        parser.error("-n must be at least 2 (percentiles need two samples)")
+    mode = "cold: compile + run" if args.cold else "warm: run only"
+    if args.jobs != 1:
+        mode += f", jobs={args.jobs or os.cpu_count()}"
 
     print()
     print("═" * 90)
-    print(f"  ChadSelect Python Benchmark — {n:,} iterations per task")
+    print(f"  ChadSelect Python Benchmark — up to {n:,} samples per task ({mode})")
     print("═" * 90)
 
-    current_engine = ""
-    results = []
+    if args.jobs == 1:
+        results = [bench_task(task, n, cold=args.cold, budget_s=args.time) for task in TASKS]
+    else:
+        workers = args.jobs or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(bench_task, task, n, args.cold, args.time) for task in TASKS]
+            results = [f.result() for f in futures]
 
-    for label, ctype, content, idx, query in TASKS:
-        engine = label.split("—")[0].strip()
-        if engine != current_engine:
-            current_engine = engine
+    current_engine = ""
+    for task, stats in zip(TASKS, results):
+        if task.engine != current_engine:
+            current_engine = task.engine
             print()
             print("─" * 90)
-            print(f"  {engine}")
+            print(f"  {task.engine}")
             print("─" * 90)
             print(f"  {'Task':<42s} {'Median':>10s} {'Mean':>10s} {'Min':>10s} {'p95':>10s} {'p99':>10s}  Hits")
             print(f"  {'─'*42} {'─'*10} {'─'*10} {'─'*10} {'─'*10} {'─'*10} ─────")
 
-        stats = bench_task(label, ctype, content, idx, query, n)
-        results.append(stats)
-
-        short = label.split("— ")[1] if "— " in label else label
         print(
-            f"  {short:<42s} "
+            f"  {task.name:<42s} "
             f"{fmt_us(stats['median']):>10s} "
             f"{fmt_us(stats['mean']):>10s} "
             f"{fmt_us(stats['min']):>10s} "
@@ -226,8 +347,9 @@ def main():
     print("═" * 90)
     medians = [r["median"] for r in results]
     print(f"  Tasks run:        {len(results)}")
-    print(f"  Fastest median:   {fmt_us(min(medians)):>10s}  ({results[medians.index(min(medians))]['label']})")
-    print(f"  Slowest median:   {fmt_us(max(medians)):>10s}  ({results[medians.index(max(medians))]['label']})")
+    print(f"  Samples taken:    {sum(r['samples'] for r in results):,}")
+    print(f"  Fastest median:   {fmt_us(min(medians)):>10s}  ({TASKS[medians.index(min(medians))].label})")
+    print(f"  Slowest median:   {fmt_us(max(medians)):>10s}  ({TASKS[medians.index(max(medians))].label})")
     print(f"  Overall median:   {fmt_us(statistics.median(medians)):>10s}")
     print(f"  Overall mean:     {fmt_us(statistics.mean(medians)):>10s}")
     print("═" * 90)
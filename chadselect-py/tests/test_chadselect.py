@@ -5,8 +5,10 @@ Organized by engine (CSS, XPath, Regex, JMESPath), then text functions,
 integration tests, and edge cases.
 """
 
+from functools import lru_cache
+
 import pytest
-from chadselect import ChadSelect
+from chadselect import ChadSelect, QueryType, memoize, parse_query
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -105,15 +107,96 @@ class TestContentManagement:
         cs = ChadSelect()
         assert cs.query(-1, "regex:anything") == []
 
+    def test_parsed_trees_are_cached_per_item(self):
+        cs = ChadSelect()
+        cs.add_html(HTML)
+        first = cs.query(-1, "css:.price")
+        assert cs.query(-1, "xpath://span[@class='price']/text()") == ["$100", "$200"]
+        item = cs._content_list[0]
+        assert item.html_tree() is item.html_tree()
+        assert item.lxml_tree() is item.lxml_tree()
+        assert cs.query(-1, "css:.price") == first
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
-#  CSS Engine
+#  Query prefix parsing
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class TestCSS:
+class TestParseQuery:
+    def test_prefixes(self):
+        assert parse_query("css:.price") == (QueryType.CSS, ".price")
+        assert parse_query("xpath://h1") == (QueryType.XPATH, "//h1")
+        assert parse_query("json:a.b") == (QueryType.JSON, "a.b")
+        assert parse_query(r"regex:\d+") == (QueryType.REGEX, r"\d+")
+
+    def test_no_prefix_defaults_to_regex(self):
+        assert parse_query("") == (QueryType.REGEX, "")
+        assert parse_query("cs:.x") == (QueryType.REGEX, "cs:.x")
+        assert parse_query("json") == (QueryType.REGEX, "json")
+        assert parse_query("regexp:x") == (QueryType.REGEX, "regexp:x")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Compiled-expression caches
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestCompileCaches:
     def setup_method(self):
+        from chadselect._chadselect import _clear_compile_caches
+
+        _clear_compile_caches()
         self.cs = ChadSelect()
         self.cs.add_html(HTML)
+        self.cs.add_json(JSON_STORE)
+
+    def _assert_compiled_once(self, cache, query: str, runs: int = 5):
+        first = self.cs.query(-1, query)
+        for _ in range(runs - 1):
+            assert self.cs.query(-1, query) == first
+        # One compile; every later lookup (per run, per content item) hits.
+        info = cache.cache_info()
+        assert info.misses == 1
+        assert info.hits >= runs - 1
+
+    def test_xpath_compiled_once(self):
+        from chadselect.engine import xpath
+        self._assert_compiled_once(xpath._compile, "xpath://span[@class='price']/text()")
+
+    def test_regex_compiled_once(self):
+        from chadselect.engine import regex
+        self._assert_compiled_once(regex._compile, r"regex:\$(\d+)")
+
+    def test_jmespath_compiled_once(self):
+        from chadselect.engine import json
+        self._assert_compiled_once(json._compile, "json:store.inventory[].name")
+
+    def test_query_prefix_parsed_once(self):
+        self._assert_compiled_once(parse_query, "css:.price")
+
+    def test_function_chain_compiled_once(self):
+        from chadselect import _functions
+        self._assert_compiled_once(_functions._compile_chain, "css:.price >> substring-after('$')")
+
+    def test_clear_purges_jmespath_parser_cache(self):
+        import jmespath.parser
+        from chadselect._chadselect import _clear_compile_caches
+
+        self.cs.query(-1, "json:store.inventory[].name")
+        assert jmespath.parser.Parser._CACHE
+        _clear_compile_caches()
+        assert not jmespath.parser.Parser._CACHE
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  CSS Engine
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestCSS:
+    # Tests only read from ``cs`` — build it (and parse the HTML) once per class.
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_html(HTML)
 
     def test_select_by_class(self):
         results = self.cs.query(-1, "css:.price")
@@ -191,9 +274,10 @@ class TestCSS:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TestCSSPseudo:
-    def setup_method(self):
-        self.cs = ChadSelect()
-        self.cs.add_html(PSEUDO_HTML)
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_html(PSEUDO_HTML)
 
     def test_has_text(self):
         results = self.cs.query(-1, "css:.item:has-text('Exterior:') .value")
@@ -223,15 +307,26 @@ class TestCSSPseudo:
         results = self.cs.query(-1, "css:.item:has-text('Interior') .value >> trim()")
         assert results == ["Black Leather"]
 
+    def test_pseudo_arg_absent_from_document(self):
+        assert self.cs.query(-1, "css:.item:has-text('Sunroof') .value") == []
+        assert self.cs.query(-1, "css:.value:text-equals('Red')") == []
+
+    def test_pseudo_text_spanning_nodes_and_entities(self):
+        cs = ChadSelect()
+        cs.add_html('<div class="x"><b>Exte</b>rior &amp; Trim</div>')
+        assert cs.query(-1, "css:.x:has-text('Exterior &')") == ["Exterior & Trim"]
+        assert cs.query(-1, "css:.x:text-ends('& Trim')") == ["Exterior & Trim"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  XPath Engine
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TestXPath:
-    def setup_method(self):
-        self.cs = ChadSelect()
-        self.cs.add_html(XPATH_HTML)
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_html(XPATH_HTML)
 
     def test_text_by_tag(self):
         result = self.cs.select(0, "xpath://h1/text()")
@@ -289,6 +384,13 @@ class TestXPath:
         results = self.cs.query(-1, "xpath:[[[invalid")
         assert results == []
 
+    def test_repeated_query_reuses_compiled_expression(self):
+        # Compiled XPath objects are cached — a second run (and a second
+        # invalid run) must behave exactly like the first.
+        for _ in range(2):
+            assert self.cs.query(-1, "xpath://p/text()") == ["First paragraph", "Second paragraph"]
+            assert self.cs.query(-1, "xpath:[[[invalid") == []
+
     def test_no_match(self):
         results = self.cs.query(-1, "xpath://nonexistent/text()")
         assert results == []
@@ -299,6 +401,10 @@ class TestXPath:
         assert "1GCPAAEK7TZ152448" in results
         assert "TZ152448" in results
 
+    def test_union_of_elements_and_text_nodes(self):
+        results = self.cs.query(-1, "xpath://h1 | //span[@id='stock']/text()")
+        assert results == ["Test Title", "TZ152448"]
+
     def test_index_selection(self):
         first = self.cs.query(0, "xpath://p/text()")
         assert first == ["First paragraph"]
@@ -340,29 +446,12 @@ class TestRegex:
         results = cs.query(-1, r"regex:(\d{4})-(\d{2})-(\d{2})")
         assert results == ["2024", "01", "15"]
 
-    def test_index_all(self):
-        cs = ChadSelect()
-        cs.add_text("price: $100, price: $200, price: $300")
-        results = cs.query(-1, r"regex:\$(\d+)")
-        assert results == ["100", "200", "300"]
-
-    def test_index_zero(self):
-        cs = ChadSelect()
-        cs.add_text("price: $100, price: $200, price: $300")
-        results = cs.query(0, r"regex:\$(\d+)")
-        assert results == ["100"]
-
-    def test_index_one(self):
+    def test_index_variants_in_one_batch(self):
         cs = ChadSelect()
         cs.add_text("price: $100, price: $200, price: $300")
-        results = cs.query(1, r"regex:\$(\d+)")
-        assert results == ["200"]
-
-    def test_out_of_bounds(self):
-        cs = ChadSelect()
-        cs.add_text("price: $100")
-        results = cs.query(5, r"regex:\$(\d+)")
-        assert results == []
+        pattern = r"regex:\$(\d+)"
+        results = cs.query_batch([(-1, pattern), (0, pattern), (1, pattern), (5, pattern)])
+        assert results == [["100", "200", "300"], ["100"], ["200"], []]
 
     def test_invalid_regex(self):
         cs = ChadSelect()
@@ -402,6 +491,16 @@ class TestRegex:
         results = cs.query(-1, r"regex:\$(\d+)")
         assert results == ["100", "200", "300"]
 
+    def test_index_across_multiple_content(self):
+        cs = ChadSelect()
+        cs.add_text("price: $100")
+        cs.add_text("price: $200, price: $250")
+        cs.add_html("<span>price: $300</span>")
+        assert cs.query(0, r"regex:\$(\d+)") == ["100"]
+        assert cs.query(2, r"regex:\$(\d+)") == ["250"]
+        assert cs.query(3, r"regex:\$(\d+)") == ["300"]
+        assert cs.query(4, r"regex:\$(\d+)") == []
+
     def test_works_on_json(self):
         cs = ChadSelect()
         cs.add_json('{"price": 42}')
@@ -414,9 +513,10 @@ class TestRegex:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TestJMESPath:
-    def setup_method(self):
-        self.cs = ChadSelect()
-        self.cs.add_json(JSON_STORE)
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_json(JSON_STORE)
 
     def test_simple_string_path(self):
         result = self.cs.select(0, "json:store.name")
@@ -442,6 +542,39 @@ class TestJMESPath:
         results = self.cs.query(-1, "json:store.inventory[].price")
         assert results == ["25", "50", "10"]
 
+    def test_object_value_is_compact_json(self):
+        result = self.cs.select(0, "json:store.inventory[0]")
+        assert result == '{"name":"Widget","price":25,"in_stock":true}'
+
+    def test_object_value_keeps_non_ascii(self):
+        cs = ChadSelect()
+        cs.add_json('{"car": {"make": "Citroën"}}')
+        assert cs.select(0, "json:car") == '{"make":"Citroën"}'
+
+    @pytest.mark.parametrize("doc, query, expected", [
+        ('{"id": 123456789012345678901234}', "json:id", "123456789012345678901234"),
+        ('{"o":{"v":18446744073709551616}}', "json:o", '{"v":18446744073709551616}'),
+        ('{"v":-9223372036854775809}', "json:v", "-9223372036854775809"),
+        ('{"n":{"x":NaN}}', "json:n", '{"x":NaN}'),
+        ('{"n":{"x":Infinity,"y":null}}', "json:n", '{"x":Infinity,"y":null}'),
+        ('{"f":{"x":1e400}}', "json:f", '{"x":Infinity}'),
+        ('{"a":[1,null]}', "json:@", '{"a":[1,null]}'),
+        ('{"x":1.5e16}', "json:@", '{"x":1.5e+16}'),
+        ('{"x":{"y":1e-7}}', "json:x", '{"y":1e-07}'),
+    ])
+    def test_orjson_matches_stdlib(self, monkeypatch, doc, query, expected):
+        pytest.importorskip("orjson")
+        from chadselect import _jsonlib
+
+        fast = ChadSelect()
+        fast.add_json(doc)
+        assert fast.select(0, query) == expected
+
+        monkeypatch.setattr(_jsonlib, "orjson", None)
+        stdlib = ChadSelect()
+        stdlib.add_json(doc)
+        assert stdlib.select(0, query) == expected
+
     def test_invalid_jmespath(self):
         results = self.cs.query(-1, "json:`invalid")
         assert results == []
@@ -474,112 +607,170 @@ class TestJMESPath:
         cs.add_text("hello")
         assert cs.query(-1, "json:whatever") == []
 
+    def test_filter_projection(self):
+        results = self.cs.query(-1, "json:store.inventory[?in_stock].name")
+        assert results == ["Widget", "Doohickey"]
+
+    def test_compiled_matches_jmespath(self):
+        import jmespath
+        from chadselect.engine.json import _compile
+
+        data = {
+            "a": [
+                {"b": 0, "c": [1, [2, 3]], "d": {"e": "x"}},
+                {"b": "", "c": None, "d": {"e": None}},
+                {"b": [], "c": [[]], "d": "str"},
+                {"b": False, "c": {}, "d": {"e": [4, 5]}},
+                7,
+                None,
+                [{"b": 1}],
+            ],
+            "s": "text",
+            "o": {"k": 1, "m": {"k": 2}},
+        }
+        exprs = [
+            "a", "a.b", "s.b", "o.m.k", "o.m.k.z", "a[0]", "a[-1]", "a[99]",
+            "s[0]", "a[].b", "a[*].b", "a[].c[]", "a[].c[][]", "a[].d.e",
+            "a[].d.e[]", "a[*].d.e[0]", "a[?b].c", "a[?c].b", "a[?d.e].d",
+            "a[?b == `0`].c", "a[?b != ''].b", "a[].b | [0]", "a[*].[b, c]",
+            "o.*.k", "length(a)", "a[?!b].c", "@", "`[1, 2]`[]", "o[]",
+        ]
+        for expr in exprs:
+            assert _compile(expr)(data) == jmespath.search(expr, data), expr
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Text Functions (edge cases from Rust functions_tests.rs)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class TestTextFunctions:
-    """Test text functions via CSS queries (the function chain is engine-agnostic)."""
-
-    def _apply(self, text: str, func_chain: str) -> str:
-        """Helper: apply a function chain to text via ChadSelect."""
-        cs = ChadSelect()
-        cs.add_html(f'<span class="t">{text}</span>')
-        return cs.select(0, f"css:.t >> {func_chain}")
-
-    def _apply_all(self, text: str, func_chain: str) -> list:
-        cs = ChadSelect()
-        cs.add_html(f'<span class="t">{text}</span>')
-        return cs.query(-1, f"css:.t >> {func_chain}")
-
-    def test_normalize_space(self):
-        assert self._apply("  Hello   World  ", "normalize-space()") == "Hello World"
-
-    def test_trim(self):
-        assert self._apply("  Hello World  ", "trim()") == "Hello World"
-
-    def test_uppercase(self):
-        assert self._apply("Hello World", "uppercase()") == "HELLO WORLD"
-
-    def test_lowercase(self):
-        assert self._apply("Hello World", "lowercase()") == "hello world"
-
-    def test_substring(self):
-        assert self._apply("Hello World", "substring(0, 5)") == "Hello"
-        assert self._apply("Hello World", "substring(6, 5)") == "World"
-
-    def test_substring_out_of_bounds(self):
-        assert self._apply("Hello", "substring(10, 5)") == ""
-        assert self._apply("Hello", "substring(3, 10)") == "lo"
-
-    def test_substring_after(self):
-        assert self._apply("VIN: 1HGCM82633A123456", "substring-after('VIN: ')") == "1HGCM82633A123456"
-        assert self._apply("Price: $25,000", "substring-after(': $')") == "25,000"
-
-    def test_substring_after_missing_delimiter(self):
+#: Input text → ``(function chain, expected first result)`` pairs. Each input
+#: is loaded once and all of its chains run in a single ``query_batch``.
+TEXT_FUNCTION_CASES = {
+    "Hello World": [
+        ("uppercase()", "HELLO WORLD"),
+        ("lowercase()", "hello world"),
+        ("substring(0, 5)", "Hello"),
+        ("substring(6, 5)", "World"),
         # Rust returns "" when delimiter not found
-        assert self._apply("Hello World", "substring-after('XYZ')") == ""
+        ("substring-after('XYZ')", ""),
+        # Rust returns original string when delimiter not found
+        ("substring-before('XYZ')", "Hello World"),
+        ('replace("XYZ", "ABC")', "Hello World"),
+    ],
+    "  Hello   World  ": [
+        ("normalize-space()", "Hello World"),
+        ("normalize-space() >> trim() >> uppercase()", "HELLO WORLD"),
+    ],
+    "  Hello World  ": [
+        ("trim()", "Hello World"),
+    ],
+    "Hello": [
+        ("substring(10, 5)", ""),
+        ("substring(3, 10)", "lo"),
+    ],
+    "VIN: 1HGCM82633A123456": [
+        ("substring-after('VIN: ')", "1HGCM82633A123456"),
+        ("substring-after('VIN: ') >> substring(0, 3) >> lowercase()", "1hg"),
+    ],
+    "Price: $25,000": [
+        ("substring-after(': $')", "25,000"),
+        ("substring-before(': ')", "Price"),
+    ],
+    "user@domain.com": [
+        ("substring-before('@')", "user"),
+    ],
+    "$100": [
+        ('replace("$", "USD ")', "USD 100"),
+    ],
+    "Hello Hello World": [
+        ('replace("Hello", "Hi")', "Hi Hi World"),
+    ],
+    # ── Unicode ──
+    "Hello   🌍": [
+        ("normalize-space()", "Hello 🌍"),
+    ],
+    "Hello\u3000\u00a0 World\u2003": [
+        ("normalize-space()", "Hello World"),
+    ],
+    "Hello 🌍 World": [
+        ("substring(6, 1)", "🌍"),
+    ],
+    "価格: ¥1000": [
+        ("substring-after('価格: ')", "¥1000"),
+    ],
+    "Héllo Wörld": [
+        ("uppercase()", "HÉLLO WÖRLD"),
+    ],
+    # ── Edge cases ──
+    "Hi": [
+        # Delimiter longer than the input
+        ("substring-after('This is much longer')", ""),
+    ],
+    "VIN: 123": [
+        ("substring-after('VIN: ')", "123"),
+    ],
+    "123: END": [
+        ("substring-before(': END')", "123"),
+    ],
+}
 
-    def test_substring_before(self):
-        assert self._apply("Price: $25,000", "substring-before(': ')") == "Price"
-        assert self._apply("user@domain.com", "substring-before('@')") == "user"
 
-    def test_substring_before_missing_delimiter(self):
-        # Rust returns original string when delimiter not found
-        assert self._apply("Hello World", "substring-before('XYZ')") == "Hello World"
+@lru_cache(maxsize=64)
+def _wrap(text: str) -> str:
+    """The one-span document each text-function input is loaded as."""
+    return f'<span class="t">{text}</span>'
 
-    def test_replace(self):
-        assert self._apply("$100", 'replace("$", "USD ")') == "USD 100"
 
-    def test_replace_all_occurrences(self):
-        assert self._apply("Hello Hello World", 'replace("Hello", "Hi")') == "Hi Hi World"
+class TestTextFunctions:
+    """Test text functions via CSS queries (the function chain is engine-agnostic)."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
 
-    def test_replace_no_match(self):
-        assert self._apply("Hello World", 'replace("XYZ", "ABC")') == "Hello World"
+    def _load(self, text: str) -> ChadSelect:
+        """Reset the shared instance to hold just ``<span class="t">text</span>``."""
+        self.cs.clear()
+        self.cs.add_html(_wrap(text))
+        return self.cs
 
-    def test_chain_substring_after_substring_lowercase(self):
-        assert self._apply("VIN: 1HGCM82633A123456", "substring-after('VIN: ') >> substring(0, 3) >> lowercase()") == "1hg"
+    def _apply_all(self, text: str, func_chain: str) -> list:
+        """Helper: apply a function chain to text via ChadSelect."""
+        return self._load(text).query(-1, f"css:.t >> {func_chain}")
 
-    def test_chain_normalize_trim_uppercase(self):
-        assert self._apply("  Hello   World  ", "normalize-space() >> trim() >> uppercase()") == "HELLO WORLD"
+    @pytest.mark.parametrize("text", list(TEXT_FUNCTION_CASES))
+    def test_function_cases(self, text):
+        cases = TEXT_FUNCTION_CASES[text]
+        results = self._load(text).query_batch(
+            [(0, f"css:.t >> {chain}") for chain, _ in cases]
+        )
+        for (chain, expected), result in zip(cases, results):
+            assert (result[0] if result else "") == expected, chain
 
     def test_chain_empty_result_filters_out(self):
         # substring-after with missing delimiter returns "" → gets filtered
         result = self._apply_all("Hello World", "substring-after('MISSING')")
         assert result == []
 
-    # ── Unicode ──────────────────────────────────────────────────────────
-
-    def test_unicode_normalize_space(self):
-        assert self._apply("Hello   🌍", "normalize-space()") == "Hello 🌍"
-
-    def test_unicode_substring(self):
-        assert self._apply("Hello 🌍 World", "substring(6, 1)") == "🌍"
-
-    def test_unicode_substring_after(self):
-        assert self._apply("価格: ¥1000", "substring-after('価格: ')") == "¥1000"
-
-    def test_unicode_uppercase(self):
-        assert self._apply("Héllo Wörld", "uppercase()") == "HÉLLO WÖRLD"
 
-    # ── Edge cases ───────────────────────────────────────────────────────
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Integration — select_first, select_many, select_where
+# ═══════════════════════════════════════════════════════════════════════════════
 
-    def test_delimiter_longer_than_input(self):
-        assert self._apply("Hi", "substring-after('This is much longer')") == ""
+class _EmptiedPerTest:
+    """One ChadSelect per class, cleared before each test."""
 
-    def test_delimiter_at_boundaries(self):
-        assert self._apply("VIN: 123", "substring-after('VIN: ')") == "123"
-        assert self._apply("123: END", "substring-before(': END')") == "123"
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
 
+    def setup_method(self):
+        self.cs.clear()
 
-# ═══════════════════════════════════════════════════════════════════════════════
-#  Integration — select_first, select_many, select_where
-# ═══════════════════════════════════════════════════════════════════════════════
 
-class TestSelectFirst:
+class TestSelectFirst(_EmptiedPerTest):
     def test_returns_first_hit(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_html('<span id="vin">ABC123</span>')
         result = cs.select_first([
             (0, "css:#nonexistent"),
@@ -589,7 +780,7 @@ class TestSelectFirst:
         assert result == ["ABC123"]
 
     def test_returns_empty_when_all_miss(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_text("nothing useful")
         result = cs.select_first([
             (0, "css:.nope"),
@@ -598,9 +789,9 @@ class TestSelectFirst:
         assert result == []
 
 
-class TestSelectMany:
+class TestSelectMany(_EmptiedPerTest):
     def test_combines_unique_results(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_html("""
             <span class="a">Alpha</span>
             <span class="b">Beta</span>
@@ -613,22 +804,22 @@ class TestSelectMany:
         assert len(results) == 2
 
 
-class TestSelectWhere:
+class TestSelectWhere(_EmptiedPerTest):
     def test_rejects_zero(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_text("price: 0")
         assert cs.select(0, r"(\d+)") == "0"
         r = cs.select_where(0, r"(\d+)", lambda s: s != "0")
         assert r == ""
 
     def test_accepts_non_zero(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_text("price: 42")
         r = cs.select_where(0, r"(\d+)", lambda s: s != "0")
         assert r == "42"
 
     def test_min_length_validator(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_html('<span class="v">AB</span>')
         r = cs.select_where(0, "css:.v", lambda s: len(s) >= 3)
         assert r == ""
@@ -639,7 +830,7 @@ class TestSelectWhere:
         assert r == "ABCDEF"
 
     def test_numeric_range_validator(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_json('{"price": 5}')
         r = cs.select_where(0, "json:price", lambda s: float(s) > 10.0)
         assert r == ""
@@ -650,9 +841,9 @@ class TestSelectWhere:
         assert r == "49.99"
 
 
-class TestSelectFirstWhere:
+class TestSelectFirstWhere(_EmptiedPerTest):
     def test_skips_zero_result(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_text("a: 0\nb: 99")
         r = cs.select_first_where(
             [(0, r"a: (\d+)"), (0, r"b: (\d+)")],
@@ -661,7 +852,7 @@ class TestSelectFirstWhere:
         assert r == ["99"]
 
     def test_all_rejected_returns_empty(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_text("val: 0")
         r = cs.select_first_where(
             [(0, r"(\d+)")],
@@ -669,10 +860,32 @@ class TestSelectFirstWhere:
         )
         assert r == []
 
+    def test_rejected_value_revalidated_by_default(self):
+        cs = self.cs
+        cs.add_text("a: 0\nb: 0\nc: 5")
+        seen = []
+        r = cs.select_first_where(
+            [(0, r"a: (\d+)"), (0, r"b: (\d+)"), (0, r"c: (\d+)")],
+            lambda s: seen.append(s) or s != "0",
+        )
+        assert r == ["5"]
+        assert seen == ["0", "0", "5"]
+
+    def test_memoized_rejected_value_not_revalidated(self):
+        cs = self.cs
+        cs.add_text("a: 0\nb: 0\nc: 5")
+        seen = []
+        r = cs.select_first_where(
+            [(0, r"a: (\d+)"), (0, r"b: (\d+)"), (0, r"c: (\d+)")],
+            memoize(lambda s: seen.append(s) or s != "0"),
+        )
+        assert r == ["5"]
+        assert seen == ["0", "5"]
+
 
-class TestSelectManyWhere:
+class TestSelectManyWhere(_EmptiedPerTest):
     def test_filters_results(self):
-        cs = ChadSelect()
+        cs = self.cs
         cs.add_text("1 0 42 0 7")
         r = cs.select_many_where(
             [(-1, r"(\d+)")],
@@ -683,6 +896,17 @@ class TestSelectManyWhere:
         assert "42" in r
         assert "7" in r
 
+    def test_memoized_validator_called_once_per_distinct_value(self):
+        cs = self.cs
+        cs.add_text("1 0 42 0 7 0 42")
+        seen = []
+        r = cs.select_many_where(
+            [(-1, r"(\d+)"), (-1, r"\b(\d)\b")],
+            memoize(lambda s: seen.append(s) or s != "0"),
+        )
+        assert r == ["1", "42", "7"]
+        assert sorted(seen) == ["0", "1", "42", "7"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  query_batch
@@ -708,44 +932,46 @@ class TestQueryBatch:
         cs.add_html(HTML)
         assert cs.query_batch([]) == []
 
+    def test_batch_repeated_query(self):
+        cs = ChadSelect()
+        cs.add_html(HTML)
+        results = cs.query_batch([(-1, "css:.price"), (0, "css:.price"), (-1, "css:.price")])
+        assert results[0] == results[2] == ["$100", "$200"]
+        assert results[1] == ["$100"]
+        results[0].append("mutated")
+        assert results[2] == ["$100", "$200"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Mixed content routing
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class TestMixedContent:
-    def test_css_only_on_html(self):
-        cs = ChadSelect()
-        cs.add_html(HTML)
-        cs.add_json(JSON_SIMPLE)
-        cs.add_text("plain text")
-        result = cs.query(-1, "css:.price")
-        assert len(result) == 2
+#: ``(query, expected)`` against one text + HTML + JSON payload — each engine
+#: must answer from its own content types only.
+MIXED_CASES = [
+    ("css:.price", ["$100", "$200"]),
+    ("json:items[].name", ["Alpha", "Beta"]),
+    ("json:id", ["id=300"]),
+    ("json:whatever", []),
+    (r"regex:id=(\d+)", ["100", "200", "300"]),
+]
 
-    def test_json_only_on_json(self):
-        cs = ChadSelect()
-        cs.add_html(HTML)
-        cs.add_json(JSON_SIMPLE)
-        result = cs.query(-1, "json:items[].name")
-        assert result == ["Alpha", "Beta"]
 
-    def test_regex_spans_all(self):
-        cs = ChadSelect()
-        cs.add_text("id=100")
-        cs.add_html("<div>id=200</div>")
-        cs.add_json('{"id": "id=300"}')
-        results = cs.query(-1, r"regex:id=(\d+)")
-        assert results == ["100", "200", "300"]
+class TestMixedContent:
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_text("id=100 plain text")
+        cls.cs.add_html(HTML + "<div>id=200</div>")
+        cls.cs.add_json('{"id": "id=300", "items": [{"name": "Alpha"}, {"name": "Beta"}]}')
 
-    def test_json_skips_html(self):
-        cs = ChadSelect()
-        cs.add_html("<div>hello</div>")
-        assert cs.query(-1, "json:whatever") == []
+    @pytest.mark.parametrize("query, expected", MIXED_CASES, ids=[q for q, _ in MIXED_CASES])
+    def test_routing(self, query, expected):
+        assert self.cs.query(-1, query) == expected
 
-    def test_json_skips_text(self):
-        cs = ChadSelect()
-        cs.add_text("hello")
-        assert cs.query(-1, "json:whatever") == []
+    def test_routing_batch(self):
+        results = self.cs.query_batch([(-1, q) for q, _ in MIXED_CASES])
+        assert results == [expected for _, expected in MIXED_CASES]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -782,9 +1008,10 @@ class TestDelimiterSafety:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TestNewPipeFunctions:
-    def setup_method(self):
-        self.cs = ChadSelect()
-        self.cs.add_html("""
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_html("""
         <html><body>
             <nav class="crumbs"><a>Home</a><a>Cars</a><a>Civic</a></nav>
             <span class="price">$1,299.00</span>
@@ -834,9 +1061,10 @@ class TestNewPipeFunctions:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TestTextPseudoCombinators:
-    def setup_method(self):
-        self.cs = ChadSelect()
-        self.cs.add_html("""
+    @classmethod
+    def setup_class(cls):
+        cls.cs = ChadSelect()
+        cls.cs.add_html("""
         <html><body>
             <div id="sp"><span>VIN</span><span>WP0AB2A90SS225386</span><span>extra</span></div>
             <div class="r"><span>Exterior Color</span><span>Black</span></div>